@@ -16,6 +16,8 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
+from itertools import count
+
 import numpy as np
 
 from sfm_utils.sfm import Intrinsic, IntrinsicType, Pose, Scene, View
@@ -33,6 +35,9 @@ def scene_to_alicevision(scene: Scene):
 
     Note: This is currently untested for actual use in MeshRoom
     """
+    # Bind the name map to a local so the per-intrinsic lookup skips the
+    # module-global indirection inside the conversion loops
+    intrinsic_name_map = __AV_INTRINSIC_NAME_MAP
 
     def av_view(view: View):
         """
@@ -52,15 +57,17 @@ def scene_to_alicevision(scene: Scene):
         """
         AliceVision Intrinsic struct
         """
+        intrinsic_id = str(intrinsic.id)
+        focal_px = str(intrinsic.focal_length_as_pixels)
         d = {
-            "intrinsicID": str(intrinsic.id),
+            "intrinsicID": intrinsic_id,
             "width": str(intrinsic.width),
             "height": str(intrinsic.height),
-            "serialNumber": str(intrinsic.id),
-            "type": __AV_INTRINSIC_NAME_MAP[intrinsic.type],
+            "serialNumber": intrinsic_id,
+            "type": intrinsic_name_map[intrinsic.type],
             "initializationMode": "estimated",
-            "pxInitialFocalLength": str(intrinsic.focal_length_as_pixels),
-            "pxFocalLength": str(intrinsic.focal_length_as_pixels),
+            "pxInitialFocalLength": focal_px,
+            "pxFocalLength": focal_px,
             "principalPoint": [
                 str(intrinsic.ppx),
                 str(intrinsic.ppy)
@@ -70,11 +77,22 @@ def scene_to_alicevision(scene: Scene):
 
         # Add any distortion parameters
         if intrinsic.dist_params is not None:
-            d['distortionParams'] = [str(i) for i in intrinsic.dist_params]
+            d['distortionParams'] = np.char.mod('%s', np.asarray(intrinsic.dist_params, dtype=np.float64)).tolist()
 
         return d
 
-    def av_pose(pose: Pose):
+    # Flatten every rotation to column-major order and stringify all rotations
+    # and centers in two bulk passes rather than once per pose
+    if scene.poses:
+        r = np.stack([np.asarray(pose.rotation, dtype=np.float64) for pose in scene.poses])
+        r_flat = np.ascontiguousarray(r.transpose(0, 2, 1)).reshape(len(scene.poses), 9)
+        rotation_strs = np.char.mod('%s', r_flat).tolist()
+        center_strs = np.char.mod('%s', np.asarray([pose.center for pose in scene.poses], dtype=np.float64)).tolist()
+    else:
+        rotation_strs = []
+        center_strs = []
+
+    def av_pose(idx: int, pose: Pose):
         """
         AliceVision Pose struct
         """
@@ -82,8 +100,8 @@ def scene_to_alicevision(scene: Scene):
             "poseId": str(pose.id),
             "pose": {
                 "transform": {
-                    "rotation": [str(i) for i in np.ravel(pose.rotation, order='F').tolist()],
-                    "center": [str(i) for i in pose.center]
+                    "rotation": rotation_strs[idx],
+                    "center": center_strs[idx]
                 },
                 "locked": "0"
             }
@@ -94,9 +112,9 @@ def scene_to_alicevision(scene: Scene):
     # Construct AliceVision struct
     data = {
         "version": ["1", "0", "0"],
-        "views": [av_view(view) for view in scene.views],
-        "intrinsics": [av_intrinsic(intr) for intr in scene.intrinsics],
-        "poses": [av_pose(pose) for pose in scene.poses]
+        "views": list(map(av_view, scene.views)),
+        "intrinsics": list(map(av_intrinsic, scene.intrinsics)),
+        "poses": list(map(av_pose, count(), scene.poses))
     }
 
     return data
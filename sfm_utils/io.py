@@ -2,7 +2,14 @@ import json
 from enum import auto, Enum
 from os import PathLike
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
+
+# orjson serializes large scenes several times faster than the stdlib json
+# module. Use it when available, but keep stdlib json as a fallback.
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from sfm_utils.alicevision import scene_to_alicevision
 from sfm_utils.openmvg import scene_to_openmvg
@@ -17,19 +24,41 @@ class Format(Enum):
     ALICE_VISION = auto()
 
 
+__EXPORT_BUFFER_SIZE = 1 << 20
+
+__FORMAT_DISPATCH = {
+    Format.OPEN_MVG: lambda scene, convert_rotations: scene_to_openmvg(scene, convert_rotations=convert_rotations),
+    Format.ALICE_VISION: lambda scene, convert_rotations: scene_to_alicevision(scene),
+}
+
+
 def export_scene(path: Union[str, bytes, PathLike], scene: Scene, fmt: Format = Format.OPEN_MVG,
-                 convert_rotations: bool = True):
+                 convert_rotations: bool = True, indent: Optional[int] = None):
     """
-    Export Scene to a project file
+    Export Scene to a project file. Output is compact by default since OpenMVG
+    and AliceVision do not need pretty-printed files; pass `indent` to produce
+    human-readable output.
     """
-    if fmt == Format.OPEN_MVG:
-        data = scene_to_openmvg(scene, convert_rotations=convert_rotations)
-    elif fmt == Format.ALICE_VISION:
-        data = scene_to_alicevision(scene)
-    else:
+    converter = __FORMAT_DISPATCH.get(fmt)
+    if converter is None:
         raise ValueError('Unknown scene format')
+    data = converter(scene, convert_rotations)
 
     # Write to disk
     output_file = Path(path)
-    with output_file.open(mode='w') as f:
-        json.dump(data, f, indent=4)
+    if orjson is not None and indent in (None, 2):
+        # OPT_SERIALIZE_NUMPY lets any ndarrays in the converter output go
+        # straight to the C encoder without a Python-level tolist pass
+        option = orjson.OPT_SERIALIZE_NUMPY
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        with output_file.open(mode='wb') as f:
+            f.write(orjson.dumps(data, option=option))
+    else:
+        # Stream the encoder output through a large write buffer. Peak memory
+        # stays at one encoder chunk instead of the whole serialized document,
+        # and the buffer coalesces those chunks into few syscalls.
+        separators = (',', ':') if indent is None else None
+        with output_file.open(mode='w', buffering=__EXPORT_BUFFER_SIZE, encoding='utf-8') as f:
+            for chunk in json.JSONEncoder(indent=indent, separators=separators, ensure_ascii=False).iterencode(data):
+                f.write(chunk)
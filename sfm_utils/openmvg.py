@@ -17,6 +17,7 @@ along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
 import re
+from itertools import count
 from os import PathLike
 from pathlib import Path
 from typing import Union
@@ -31,15 +32,21 @@ __OPENMVG_CAMDB_LINE_REGEXP = re.compile(r'("?)(?P<camera>[^"]+)\1;(?P<width>\d+
 
 __OPENMVG_ROT_MAT = np.array([[-1, 0, 0], [0, 1, 0], [0, 0, -1]])
 
-__OPENMVG_INTRINSIC_NAME_MAP = {
-    IntrinsicType.PINHOLE: 'pinhole',
-    IntrinsicType.RADIAL_K3: 'pinhole_radial_k3',
-    IntrinsicType.BROWN_T2: 'pinhole_brown_t2'
-}
-
-__OPENMVG_DIST_NAME_MAP = {
-    IntrinsicType.RADIAL_K3: 'disto_k3',
-    IntrinsicType.BROWN_T2: 'disto_t2'
+# First id handed out by the emulated Cereal pointer counter
+__OPENMVG_PTR_FIRST_ID = 2147483649
+
+# Static portions of the per-element structs, shared across entries and copied
+# in with a C-level dict merge rather than rebuilt per call
+__OPENMVG_VIEW_VALUE_PROTO = {'polymorphic_id': 1073741824}
+__OPENMVG_VIEW_DATA_PROTO = {'local_path': ''}
+__OPENMVG_INTRINSIC_VALUE_PROTO = {'polymorphic_id': 2147483649}
+
+# Maps intrinsic type to its OpenMVG polymorphic name and distortion key so
+# each intrinsic is dispatched with a single lookup
+__OPENMVG_INTRINSIC_TYPE_MAP = {
+    IntrinsicType.PINHOLE: ('pinhole', None),
+    IntrinsicType.RADIAL_K3: ('pinhole_radial_k3', 'disto_k3'),
+    IntrinsicType.BROWN_T2: ('pinhole_brown_t2', 'disto_t2')
 }
 
 
@@ -53,18 +60,17 @@ def openmvg_load_camdb(db_path: Union[str, bytes, PathLike, None] = None) -> dic
     else:
         file_path = Path(db_path)
 
-    # Load the cam db
+    # Load the cam db. Read the file in a single pass and run the precompiled
+    # pattern's bound match method per line; the quoted camera names rule out
+    # handing the parse to a plain delimiter-based reader.
     d = {}
-    with file_path.open() as f:
-        for line in f:
-            line = line.rstrip()
-            match = re.match(__OPENMVG_CAMDB_LINE_REGEXP, line)
-            if match is None:
-                print(f'ERROR: Cannot parse CamDB entry: {line}')
-                continue
-            key = match.group("camera")
-            value = float(match.group("width"))
-            d[key] = value
+    match_line = __OPENMVG_CAMDB_LINE_REGEXP.match
+    for line in file_path.read_text(encoding='utf-8').splitlines():
+        match = match_line(line)
+        if match is None:
+            print(f'ERROR: Cannot parse CamDB entry: {line}')
+            continue
+        d[match.group('camera')] = float(match.group('width'))
     return d
 
 
@@ -72,47 +78,48 @@ def scene_to_openmvg(scene: Scene, convert_rotations: bool = True):
     """
     Convert Scene to an OpenMVG-formatted dict. This dict can be written to a project file with the json package.
     """
-    # Emulate the Cereal pointer counter
-    __ptr_cnt = 2147483649
+    # Bind the module-level map and rotation matrix to locals so the
+    # per-element lookups inside the conversion loops skip the global scope
+    intrinsic_type_map = __OPENMVG_INTRINSIC_TYPE_MAP
+    rot_mat = __OPENMVG_ROT_MAT
 
-    def open_mvg_view(view: View) -> dict:
+    def open_mvg_view(ptr_id: int, view: View) -> dict:
         """
         OpenMVG View struct
         """
-        nonlocal __ptr_cnt
+        view_id = view.id
         d = {
-            "key": view.id,
+            "key": view_id,
             "value": {
-                "polymorphic_id": 1073741824,
+                **__OPENMVG_VIEW_VALUE_PROTO,
                 "ptr_wrapper": {
-                    "id": __ptr_cnt,
+                    "id": ptr_id,
                     "data": {
-                        "local_path": '',
-                        "filename": str(view.path.name),
+                        **__OPENMVG_VIEW_DATA_PROTO,
+                        "filename": view.path.name,
                         "width": view.width,
                         "height": view.height,
-                        "id_view": view.id,
+                        "id_view": view_id,
                         "id_intrinsic": view.intrinsic.id,
                         "id_pose": view.pose.id,
                     }
                 }
             }
         }
-        __ptr_cnt += 1
         return d
 
-    def open_mvg_intrinsic(intrinsic: Intrinsic) -> dict:
+    def open_mvg_intrinsic(ptr_id: int, intrinsic: Intrinsic) -> dict:
         """
         OpenMVG Intrinsic struct
         """
-        nonlocal __ptr_cnt
+        name, dist_name = intrinsic_type_map[intrinsic.type]
         d = {
             'key': intrinsic.id,
             'value': {
-                'polymorphic_id': 2147483649,
-                "polymorphic_name": __OPENMVG_INTRINSIC_NAME_MAP[intrinsic.type],
+                **__OPENMVG_INTRINSIC_VALUE_PROTO,
+                "polymorphic_name": name,
                 "ptr_wrapper": {
-                    "id": __ptr_cnt,
+                    "id": ptr_id,
                     "data": {
                         "width": intrinsic.width,
                         "height": intrinsic.height,
@@ -125,23 +132,30 @@ def scene_to_openmvg(scene: Scene, convert_rotations: bool = True):
                 }
             }
         }
-        __ptr_cnt += 1
 
         if intrinsic.dist_params is not None:
-            dist_name = __OPENMVG_DIST_NAME_MAP[intrinsic.type]
             d['value']['ptr_wrapper']['data'][dist_name] = intrinsic.dist_params
 
         return d
 
-    def open_mvg_extrinsic(extrinsic: Pose) -> dict:
+    # Convert every pose rotation with a single batched matmul rather than
+    # one 3x3 product (and its NumPy dispatch overhead) per pose
+    if scene.poses:
+        rotations = np.stack([pose.rotation for pose in scene.poses])
+        if convert_rotations:
+            rotations = rot_mat @ rotations
+        rotation_lists = rotations.tolist()
+    else:
+        rotation_lists = []
+
+    def open_mvg_extrinsic(idx: int, extrinsic: Pose) -> dict:
         """
         OpenMVG Extrinsic struct
         """
         d = {
             "key": extrinsic.id,
             "value": {
-                "rotation": (
-                    __OPENMVG_ROT_MAT @ extrinsic.rotation if convert_rotations else extrinsic.rotation).tolist(),
+                "rotation": rotation_lists[idx],
                 "center": extrinsic.center
             }
         }
@@ -151,9 +165,10 @@ def scene_to_openmvg(scene: Scene, convert_rotations: bool = True):
     data = {
         'sfm_data_version': '0.3',
         'root_path': str(scene.root_dir),
-        'views': [open_mvg_view(view) for view in scene.views],
-        'intrinsics': [open_mvg_intrinsic(intr) for intr in scene.intrinsics],
-        'extrinsics': [open_mvg_extrinsic(extr) for extr in scene.poses],
+        'views': list(map(open_mvg_view, count(__OPENMVG_PTR_FIRST_ID), scene.views)),
+        'intrinsics': list(map(open_mvg_intrinsic, count(__OPENMVG_PTR_FIRST_ID + len(scene.views)),
+                               scene.intrinsics)),
+        'extrinsics': list(map(open_mvg_extrinsic, count(), scene.poses)),
         'structure': [],
         'control_points': []
     }
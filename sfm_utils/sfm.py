@@ -16,14 +16,19 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-from abc import ABC
 from enum import auto, Enum
 from os import PathLike
 from pathlib import Path
-from typing import List, Tuple, Union
+from typing import List, Sequence, Tuple, Union
 
 import numpy as np
 
+# Shared defaults returned by Pose when no explicit value has been assigned.
+# The rotation is marked read-only since it is shared between instances.
+_POSE_DEFAULT_ROTATION = np.eye(3)
+_POSE_DEFAULT_ROTATION.setflags(write=False)
+_POSE_DEFAULT_CENTER = (0., 0., 0.)
+
 
 class IntrinsicType(Enum):
     PINHOLE = auto()
@@ -31,11 +36,14 @@ class IntrinsicType(Enum):
     BROWN_T2 = auto()
 
 
-class SceneElement(ABC):
+class SceneElement:
     """
     Base class for SfM scene elements
     """
-    _id = None
+    __slots__ = ('_id',)
+
+    def __init__(self):
+        self._id = None
 
     @property
     def id(self):
@@ -53,14 +61,23 @@ class Intrinsic(SceneElement):
     """
     Basic pinhole camera intrinsic
     """
-    _image_width = None
-    _image_height = None
-    _ppx = None
-    _ppy = None
-    _focal_length = None
-    _focal_length_as_pixels = None
-    _sensor_width = None
-    _dist_params = None
+    __slots__ = ('_image_width', '_image_height', '_ppx', '_ppy', '_focal_length', '_focal_length_as_pixels',
+                 '_sensor_width', '_dist_params', '_cached_ppx', '_cached_ppy', '_cached_fl_px')
+
+    def __init__(self):
+        super().__init__()
+        self._image_width = None
+        self._image_height = None
+        self._ppx = None
+        self._ppy = None
+        self._focal_length = None
+        self._focal_length_as_pixels = None
+        self._sensor_width = None
+        self._dist_params = None
+        # Memoized derived values, reset by the setters they depend on
+        self._cached_ppx = None
+        self._cached_ppy = None
+        self._cached_fl_px = None
 
     def __eq__(self, other):
         if not isinstance(other, Intrinsic) or self.type != other.type:
@@ -73,6 +90,14 @@ class Intrinsic(SceneElement):
         eq = eq and self.focal_length_as_pixels == other.focal_length_as_pixels
         return eq
 
+    def _signature(self) -> tuple:
+        """
+        Hashable key identifying this intrinsic for deduplication. Two intrinsics of the same type are equal iff their
+        signatures match.
+        """
+        return (self.type, self.width, self.height, self.ppx, self.ppy, self.focal_length_as_pixels,
+                tuple(self._dist_params) if self._dist_params is not None else None)
+
     @property
     def type(self) -> IntrinsicType:
         """
@@ -90,6 +115,8 @@ class Intrinsic(SceneElement):
     @width.setter
     def width(self, w: int):
         self._image_width = w
+        self._cached_ppx = None
+        self._cached_fl_px = None
 
     @property
     def height(self) -> int:
@@ -101,16 +128,19 @@ class Intrinsic(SceneElement):
     @height.setter
     def height(self, h: int):
         self._image_height = h
+        self._cached_ppy = None
+        self._cached_fl_px = None
 
     @property
     def ppx(self) -> float:
         """
         Principal point X position, in pixels
         """
-        if self._ppx is None:
-            return self.width / 2.0
-        else:
+        if self._ppx is not None:
             return self._ppx
+        if self._cached_ppx is None:
+            self._cached_ppx = self.width / 2.0
+        return self._cached_ppx
 
     @ppx.setter
     def ppx(self, x: float):
@@ -121,10 +151,11 @@ class Intrinsic(SceneElement):
         """
         Principal point Y position, in pixels
         """
-        if self._ppy is None:
-            return self.height / 2.0
-        else:
+        if self._ppy is not None:
             return self._ppy
+        if self._cached_ppy is None:
+            self._cached_ppy = self.height / 2.0
+        return self._cached_ppy
 
     @ppy.setter
     def ppy(self, y: float):
@@ -147,16 +178,18 @@ class Intrinsic(SceneElement):
     @focal_length.setter
     def focal_length(self, f: float):
         self._focal_length = f
+        self._cached_fl_px = None
 
     @property
     def focal_length_as_pixels(self) -> float:
         """
         Effective lens focal length, in pixels
         """
-        if self._focal_length_as_pixels is None:
-            return max(self.width, self.height) * self.focal_length / self.sensor_width
-        else:
+        if self._focal_length_as_pixels is not None:
             return self._focal_length_as_pixels
+        if self._cached_fl_px is None:
+            self._cached_fl_px = max(self.width, self.height) * self.focal_length / self.sensor_width
+        return self._cached_fl_px
 
     @focal_length_as_pixels.setter
     def focal_length_as_pixels(self, f: float):
@@ -173,6 +206,7 @@ class Intrinsic(SceneElement):
     @sensor_width.setter
     def sensor_width(self, w: float):
         self._sensor_width = w
+        self._cached_fl_px = None
 
     @property
     def dist_params(self) -> List[float]:
@@ -186,6 +220,7 @@ class IntrinsicRadialK3(Intrinsic):
     """
     Pinhole intrinsic with three radial distortion coefficients
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -205,14 +240,15 @@ class IntrinsicRadialK3(Intrinsic):
         return IntrinsicType.RADIAL_K3
 
     @Intrinsic.dist_params.setter
-    def dist_params(self, p: List[float]):
-        self._dist_params = p[0:3]
+    def dist_params(self, p: Sequence[float]):
+        self._dist_params = p if type(p) is list and len(p) == 3 else list(p[:3])
 
 
 class IntrinsicBrownT2(Intrinsic):
     """
     Pinhole intrinsic with three radial distortion and two tangential coefficients
     """
+    __slots__ = ()
 
     def __init__(self):
         super().__init__()
@@ -232,30 +268,34 @@ class IntrinsicBrownT2(Intrinsic):
         return IntrinsicType.BROWN_T2
 
     @Intrinsic.dist_params.setter
-    def dist_params(self, p: List[float]):
-        self._dist_params = p[0:5]
+    def dist_params(self, p: Sequence[float]):
+        self._dist_params = p if type(p) is list and len(p) == 5 else list(p[:5])
 
 
 class Pose(SceneElement):
     """
     Camera pose as center position and rotation matrix. This package assumes that rotations use a right-handed system.
     """
-    _center = None
-    _rotation = None
+    __slots__ = ('_center', '_rotation')
+
+    def __init__(self):
+        super().__init__()
+        self._center = None
+        self._rotation = None
 
     @property
-    def center(self) -> List[float]:
+    def center(self) -> Sequence[float]:
         """
         Camera position in world coordinates
         """
         if self._center is None:
-            return [0., 0., 0.]
+            return _POSE_DEFAULT_CENTER
         else:
             return self._center
 
     @center.setter
-    def center(self, c: List[float]):
-        self._center = c[0:3]
+    def center(self, c: Sequence[float]):
+        self._center = c if type(c) is list and len(c) == 3 else list(c[:3])
 
     @property
     def rotation(self) -> np.ndarray:
@@ -263,7 +303,7 @@ class Pose(SceneElement):
         Camera rotation matrix
         """
         if self._rotation is None:
-            return np.eye(3)
+            return _POSE_DEFAULT_ROTATION
         else:
             return self._rotation
 
@@ -276,13 +316,19 @@ class View(SceneElement):
     """
     Observation of scene (i.e. image file) and related parameters
     """
-    _path = None
-    _intrinsic = None
-    _pose = None
-    _image_width = None
-    _image_height = None
-    _make = None
-    _model = None
+    __slots__ = ('_path', '_intrinsic', '_pose', '_image_width', '_image_height', '_make', '_model', '_make_model')
+
+    def __init__(self):
+        super().__init__()
+        self._path = None
+        self._intrinsic = None
+        self._pose = None
+        self._image_width = None
+        self._image_height = None
+        self._make = None
+        self._model = None
+        # Memoized make/model string, reset by the make and model setters
+        self._make_model = None
 
     @property
     def path(self) -> Path:
@@ -293,7 +339,7 @@ class View(SceneElement):
 
     @path.setter
     def path(self, path: Union[str, bytes, PathLike]):
-        self._path = Path(path)
+        self._path = path if isinstance(path, Path) else Path(path)
 
     @property
     def intrinsic(self) -> Intrinsic:
@@ -349,6 +395,7 @@ class View(SceneElement):
     @camera_make.setter
     def camera_make(self, m: str):
         self._make = m
+        self._make_model = None
 
     @property
     def camera_model(self) -> str:
@@ -360,28 +407,30 @@ class View(SceneElement):
     @camera_model.setter
     def camera_model(self, m: str):
         self._model = m
+        self._make_model = None
 
     @property
     def camera_make_model(self) -> str:
         """
         View camera make and model as single string
         """
-        return f'{self.camera_make} {self.camera_model}'
+        if self._make_model is None:
+            self._make_model = f'{self._make} {self._model}'
+        return self._make_model
 
 
 class Scene:
     """
     SfM scene
     """
-    _root = None
-    _views = None
-    _intrinsics = None
-    _poses = None
+    __slots__ = ('_root', '_views', '_intrinsics', '_poses', '_intrinsic_index')
 
     def __init__(self):
+        self._root = None
         self._views = []
         self._intrinsics = []
         self._poses = []
+        self._intrinsic_index = {}
 
     @property
     def root_dir(self) -> Path:
@@ -392,7 +441,7 @@ class Scene:
 
     @root_dir.setter
     def root_dir(self, p: Union[str, bytes, PathLike]):
-        self._root = Path(p)
+        self._root = p if isinstance(p, Path) else Path(p)
 
     @property
     def views(self) -> List[View]:
@@ -423,22 +472,39 @@ class Scene:
     @intrinsics.setter
     def intrinsics(self, intrinsics: List[Intrinsic]):
         self._intrinsics = intrinsics
+        self._intrinsic_index = {}
+        for intrinsic in intrinsics:
+            try:
+                self._intrinsic_index.setdefault(intrinsic._signature(), intrinsic)
+            except TypeError:
+                continue
 
     def add_intrinsic(self, intrinsic: Intrinsic, group_models: bool = True) -> Intrinsic:
         """
         Add an Intrinsic to the scene and return the added Intrinsic. The returned Intrinsic should be assigned to the
         associated View object. If `group_models` is True and the passed Intrinsic is identical to one already in the
         scene, the passed Intrinsic is ignored and the existing one is returned.
-        """
-        # See if there's an identical intrinsic already
-        if group_models:
-            for existing in self._intrinsics:
-                if intrinsic == existing:
-                    return existing
+
+        Grouping is backed by an index keyed on each intrinsic's values at the time it was added. Do not modify an
+        Intrinsic after adding it to the scene: later calls may fail to group against its current values. To change a
+        camera model, build a new Intrinsic and reassign the scene's intrinsics list.
+        """
+        # See if there's an identical intrinsic already. Intrinsics whose
+        # derived values cannot be computed yet are appended unindexed.
+        try:
+            key = intrinsic._signature()
+        except TypeError:
+            key = None
+        if group_models and key is not None:
+            existing = self._intrinsic_index.get(key)
+            if existing is not None:
+                return existing
 
         # If not, make a new one
         intrinsic.id = len(self._intrinsics)
         self._intrinsics.append(intrinsic)
+        if key is not None:
+            self._intrinsic_index.setdefault(key, intrinsic)
         return intrinsic
 
     @property
@@ -16,12 +16,15 @@ You should have received a copy of the GNU General Public License
 along with this program.  If not, see <https://www.gnu.org/licenses/>.
 """
 
-import os
+import json
 import unittest
 from pathlib import Path
 
 import sfm_utils as sfm
 
+# Directory of expected files
+_EXPECTED_DIR = Path(__file__).resolve().parent / 'expected'
+
 
 class TestIntrinsics(unittest.TestCase):
     def test_defaults(self):
@@ -90,10 +93,12 @@ class TestIntrinsics(unittest.TestCase):
 
 
 class TestIO(unittest.TestCase):
-    def setUp(self) -> None:
-        # Create scene
-        self.scene = sfm.Scene()
-        self.scene.root_dir = '.'
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Create scene. Nothing in this class mutates it, so it is built once
+        # and its converted forms are cached for every test
+        cls.scene = sfm.Scene()
+        cls.scene.root_dir = '.'
 
         # Construct a view
         view = sfm.View()
@@ -102,7 +107,7 @@ class TestIO(unittest.TestCase):
         view.height = 100
         view.camera_make = 'PySfMUtils'
         view.camera_model = 'Test Camera'
-        self.scene.add_view(view)
+        cls.scene.add_view(view)
 
         # Add the view intrinsic
         intrinsic = sfm.Intrinsic()
@@ -110,28 +115,26 @@ class TestIO(unittest.TestCase):
         intrinsic.height = view.height
         intrinsic.focal_length = 10
         intrinsic.sensor_width = 10
-        view.intrinsic = self.scene.add_intrinsic(intrinsic)
+        view.intrinsic = cls.scene.add_intrinsic(intrinsic)
 
         # Add the view pose
         pose = sfm.Pose()
-        view.pose = self.scene.add_pose(pose)
+        view.pose = cls.scene.add_pose(pose)
 
-    def test_export_scene(self):
-        import json
-        # Directory of expected files
-        expected_dir = Path(os.path.realpath(__file__)).parent / 'expected'
+        # Convert and encode the scene once per format
+        cls.openmvg_result = json.dumps(sfm.scene_to_openmvg(cls.scene), indent=4)
+        cls.av_result = json.dumps(sfm.scene_to_alicevision(cls.scene), indent=4)
 
+        # Load the expected files once
+        cls.openmvg_expected = (_EXPECTED_DIR / 'openmvg_sfm.json').read_text()
+        cls.av_expected = (_EXPECTED_DIR / 'alicevision_sfm.json').read_text()
+
+    def test_export_scene(self):
         # Compare the OpenMVG results
-        with Path(expected_dir / 'openmvg_sfm.json').open('r') as f:
-            openmvg_expected = f.read()
-        openmvg_result = json.dumps(sfm.scene_to_openmvg(self.scene), indent=4)
-        self.assertEqual(openmvg_expected, openmvg_result)
+        self.assertEqual(self.openmvg_expected, self.openmvg_result)
 
         # Compare the AliceVision results
-        with Path(expected_dir / 'alicevision_sfm.json').open('r') as f:
-            av_expected = f.read()
-        av_result = json.dumps(sfm.scene_to_alicevision(self.scene), indent=4)
-        self.assertEqual(av_expected, av_result)
+        self.assertEqual(self.av_expected, self.av_result)
 
 
 if __name__ == '__main__':